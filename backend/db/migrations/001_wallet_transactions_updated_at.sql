@@ -0,0 +1,23 @@
+-- Maintain wallet_transactions.updated_at server-side.
+--
+-- The API previously sent "updated_at": "now()" with every status update,
+-- which PostgREST stores as a literal string, not a function call. A trigger
+-- keeps the column correct without any client-provided value, and lets the
+-- API issue updates with Prefer: return=minimal.
+--
+-- Apply via Supabase SQL Editor or `supabase db push`.
+
+CREATE OR REPLACE FUNCTION set_wallet_transactions_updated_at()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.updated_at = now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_wallet_transactions_updated_at ON wallet_transactions;
+
+CREATE TRIGGER trg_wallet_transactions_updated_at
+    BEFORE UPDATE ON wallet_transactions
+    FOR EACH ROW
+    EXECUTE FUNCTION set_wallet_transactions_updated_at();
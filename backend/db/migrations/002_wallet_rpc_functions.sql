@@ -0,0 +1,38 @@
+-- RPC function that coalesces the wallet-create flow into one call.
+--
+-- create_wallet_if_absent: existence check + insert in a single statement
+--   (ON CONFLICT DO NOTHING). Returns the inserted row, or no rows when a
+--   wallet already exists for the room - the API maps that to HTTP 409.
+--
+-- p_room_id is text, matching the column and the API contract ("UUID or
+-- string identifier") - typing it uuid would 500 every create for the
+-- non-UUID room ids that are in active use.
+--
+-- Apply via Supabase SQL Editor or `supabase db push`.
+
+CREATE OR REPLACE FUNCTION create_wallet_if_absent(
+    p_room_id text,
+    p_owner_account_name text,
+    p_owner_address text,
+    p_smart_account_address text,
+    p_network text DEFAULT 'base'
+) RETURNS SETOF agent_wallets AS $$
+    INSERT INTO agent_wallets (
+        room_id,
+        owner_account_name,
+        address,
+        smart_account_address,
+        account_name,
+        network
+    )
+    VALUES (
+        p_room_id,
+        p_owner_account_name,
+        p_owner_address,
+        p_smart_account_address,
+        p_owner_account_name,  -- account_name kept for backwards compatibility
+        p_network
+    )
+    ON CONFLICT (room_id) DO NOTHING
+    RETURNING *;
+$$ LANGUAGE sql;
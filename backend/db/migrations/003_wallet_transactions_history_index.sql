@@ -0,0 +1,15 @@
+-- Composite index covering the transaction-history read path.
+--
+-- get_transactions filters on room_id (optionally status) and orders by
+-- created_at DESC; without a matching index Postgres falls back to a
+-- sequential scan plus sort once the table grows. This index serves both
+-- the filtered and unfiltered variants (room_id prefix) and matches the
+-- ORDER BY direction, so paginated reads become index range scans. It
+-- also powers the keyset-pagination cursor (created_at < :cursor).
+--
+-- CONCURRENTLY avoids locking writes while the index builds; run outside
+-- a transaction block (Supabase SQL Editor runs it fine as a single
+-- statement).
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_wtx_room_status_created
+    ON wallet_transactions (room_id, status, created_at DESC);
@@ -1521,7 +1521,9 @@ Keep it concise and actionable. Automatically include these guardrails:
         room_id: str = PathParam(..., description="Room ID"),
         limit: int = Query(50, description="Maximum number of records to return"),
         offset: int = Query(0, description="Number of records to skip"),
-        status: Optional[str] = Query(None, description="Filter by status (pending, success, failed)")
+        status: Optional[str] = Query(None, description="Filter by status (pending, success, failed)"),
+        cursor: Optional[str] = Query(None, description="Keyset cursor from a previous page's next_cursor"),
+        with_total: bool = Query(False, description="Also compute the exact total count")
     ):
         """
         Get transaction history for a room's wallet.
@@ -1535,6 +1537,8 @@ Keep it concise and actionable. Automatically include these guardrails:
             limit: Maximum number of records to return (default: 50, max: 100)
             offset: Number of records to skip (default: 0)
             status: Filter by status ('pending', 'success', 'failed'), or None for all
+            cursor: Opaque keyset cursor from a previous page's next_cursor
+            with_total: When true, the response's total field is populated
 
         Returns:
             dict: Transaction history from Wallet API
@@ -1586,6 +1590,10 @@ Keep it concise and actionable. Automatically include these guardrails:
             }
             if status:
                 params["status"] = status
+            if cursor:
+                params["cursor"] = cursor
+            if with_total:
+                params["with_total"] = "true"
 
             # Call Wallet API using resolved internal room ID
             wallet_response = requests.get(
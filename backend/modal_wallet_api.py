@@ -51,16 +51,14 @@ app = modal.App("agentica-wallet-api")
 # DOCKER IMAGE CONFIGURATION
 # ============================================================================
 
-# API image with all dependencies
+# API image with all dependencies. Installed from requirements.txt so the
+# image can never drift from what wallet_api actually imports (a hardcoded
+# list here previously missed orjson/structlog/httpx[http2] and the
+# container died on import)
 api_image = (
     modal.Image.debian_slim(python_version="3.11")
-    .pip_install(
-        "fastapi[standard]>=0.104.0",  # Web framework with uvicorn
-        "cdp-sdk>=0.11.0",              # CDP Server Wallet v2
-        "web3>=6.0.0",                  # Web3 for blockchain interactions
-        "supabase>=2.0.0",              # Database client
-        "python-dotenv>=1.0.0",         # Environment variables
-        "pydantic>=2.0.0",              # Request/response validation
+    .pip_install_from_requirements(
+        str(Path(__file__).parent / "requirements.txt")
     )
     # Add wallet_api module to the image
     .add_local_dir(
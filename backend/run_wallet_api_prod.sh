@@ -0,0 +1,26 @@
+#!/bin/bash
+# Production entrypoint for the Wallet API (non-Modal deployments).
+#
+# Runs uvicorn workers under gunicorn with uvloop + httptools from
+# uvicorn[standard]. Worker count defaults to 2*CPU+1, override with
+# WEB_CONCURRENCY.
+#
+# --preload imports the app (including the CDP SDK tree) once in the
+# parent so forked workers share the code pages copy-on-write; per-worker
+# connections are still opened post-fork in the app's lifespan hook.
+#
+# Usage:
+#   ./run_wallet_api_prod.sh
+
+set -euo pipefail
+
+cd "$(dirname "$0")"
+
+WORKERS="${WEB_CONCURRENCY:-$(( 2 * $(nproc) + 1 ))}"
+
+exec gunicorn wallet_api.main:app \
+    -k uvicorn.workers.UvicornWorker \
+    -w "$WORKERS" \
+    --preload \
+    --bind 0.0.0.0:8000 \
+    --keep-alive 75
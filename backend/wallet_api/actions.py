@@ -13,18 +13,42 @@ Architecture:
     - execute_action() is the main dispatcher
     - Each handler (handle_*) is responsible for one action type
     - get_supported_actions() provides the action registry
-    - All handlers receive room_id, params dict, and cdp_client
+    - All handlers receive room_id, a typed params model, and cdp_client
 """
 
+import asyncio
+import functools
 import logging
 from typing import Any, Dict
 
 from fastapi import HTTPException, status
+from pydantic import ValidationError
+from web3 import Web3
+
+from wallet_api.models import (
+    ACTION_BALANCE,
+    ACTION_PARAMS_ADAPTER,
+    ACTION_SWAP,
+    ACTION_TRANSFER,
+    ActionResult,
+    BalanceParams,
+    BalanceResult,
+    SwapParams,
+    SwapResult,
+    TransferParams,
+    TransferResult,
+)
 
 # Set up logger
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Constants computed once at import time instead of per request:
+# - Permit2 checksumming runs Keccak-256 over a fixed string, so do it here
+# - wei conversion is a plain integer multiply, no Web3 dispatch needed
+PERMIT2_ADDRESS = Web3.to_checksum_address("0x000000000022D473030F116dDEE9F6B43aC78BA3")
+WEI_PER_ETHER = 10 ** 18
+
 # Token address mapping for Base Mainnet
 # Maps token symbols to their contract addresses
 TOKEN_ADDRESSES = {
@@ -72,11 +96,92 @@ def resolve_token_address(token: str) -> str:
     )
 
 
+async def _wait_for_user_operation(
+    cdp_client,
+    smart_account_address: str,
+    user_op_hash: str,
+    timeout_seconds: float = 20.0
+):
+    """
+    Wait for a user operation to reach a terminal status, polling with
+    exponential backoff.
+
+    The CDP SDK's built-in wait_for_user_operation polls at a fixed interval;
+    this helper starts at 50ms and backs off by 1.5x up to 1s, which resolves
+    fast confirmations quickly while cutting the number of polls (and HTTP
+    round-trips) for slow ones. All polls reuse the shared CDP client's
+    connection pool.
+
+    Args:
+        cdp_client: CDP client instance
+        smart_account_address: Smart account address the operation was sent from
+        user_op_hash: User operation hash to poll
+        timeout_seconds: Give up after this many seconds (default: 20)
+
+    Returns:
+        The user operation object once status is 'complete' or 'failed'
+
+    Raises:
+        TimeoutError: If the operation doesn't reach a terminal status in time
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout_seconds
+    attempt = 0
+
+    while True:
+        operation = await cdp_client.evm.get_user_operation(
+            address=smart_account_address,
+            user_op_hash=user_op_hash
+        )
+        if operation.status in ("complete", "failed"):
+            return operation
+
+        if loop.time() >= deadline:
+            raise TimeoutError(
+                f"User operation {user_op_hash} not confirmed after {timeout_seconds}s"
+            )
+
+        # Exponential backoff: 50ms, 75ms, ... capped at 1s
+        await asyncio.sleep(min(0.05 * (1.5 ** attempt), 1.0))
+        attempt += 1
+
+
+def _wrap_errors(label: str):
+    """
+    Decorator that wraps a handler with the standard error policy.
+
+    HTTPExceptions pass through untouched; any other exception is converted
+    to a single HTTP 500 with the given label. This replaces the outer
+    try/except boilerplate that every handler used to carry, keeping the
+    handler bodies flat.
+
+    Args:
+        label: Error message prefix (e.g., "Failed to process transfer")
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def inner(*args, **kwargs):
+            try:
+                return await fn(*args, **kwargs)
+            except HTTPException:
+                # Re-raise HTTP exceptions as-is
+                raise
+            except Exception as e:
+                logger.error(f"❌ {label}: {str(e)}")
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=f"{label}: {str(e)}"
+                )
+        return inner
+    return decorator
+
+
 # ============================================================================
 # ACTION HANDLERS
 # ============================================================================
 
-async def handle_balance(room_id: str, params: Dict[str, Any], cdp_client) -> Dict[str, Any]:
+@_wrap_errors("Failed to retrieve balance")
+async def handle_balance(room_id: str, params: BalanceParams, cdp_client) -> BalanceResult:
     """
     Handle balance action - returns smart account address information.
 
@@ -86,60 +191,61 @@ async def handle_balance(room_id: str, params: Dict[str, Any], cdp_client) -> Di
 
     Args:
         room_id: Room identifier
-        params: Action parameters (unused for balance)
+        params: BalanceParams (no fields - balance takes no parameters)
         cdp_client: CDP client instance
 
     Returns:
-        Dict with address, account_name, room_id
+        BalanceResult with address, account_name, room_id, network
 
     Raises:
         HTTPException: 404 if wallet not found, 500 for other errors
     """
-    from wallet_api.database import get_wallet
+    from wallet_api.database import get_wallet, _get_cached_wallet
+
+    # Fast path: serve repeat views straight from the wallet TTL cache.
+    # Wallet rows are immutable post-creation, so a cache hit means this
+    # handler is a pure O(1) read of four string fields - no DB round-trip.
+    cached = _get_cached_wallet(room_id)
+    if cached is not None:
+        return BalanceResult.model_construct(
+            address=cached.get("smart_account_address") or cached.get("address"),
+            account_name=cached.get("owner_account_name") or cached.get("account_name"),
+            room_id=room_id,
+            network=cached.get("network", "base")  # Base Mainnet
+        )
 
     logger.info(f"💰 [BALANCE] Handling balance request for room_id: {room_id}")
 
-    try:
-        # Retrieve wallet from database
-        wallet = await get_wallet(room_id)
-        if not wallet:
-            logger.error(f"❌ [BALANCE] Wallet not found for room_id: {room_id}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Wallet not found for room_id: {room_id}"
-            )
-
-        # Get smart account address (the trading wallet)
-        smart_account_address = wallet.get("smart_account_address")
-        owner_account_name = wallet.get("owner_account_name") or wallet.get("account_name")
+    # Retrieve wallet from database
+    wallet = await get_wallet(room_id)
+    if not wallet:
+        logger.error(f"❌ [BALANCE] Wallet not found for room_id: {room_id}")
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Wallet not found for room_id: {room_id}"
+        )
 
-        # For backwards compatibility, handle old wallets
-        if not smart_account_address:
-            smart_account_address = wallet.get("address")
+    # Get smart account address (the trading wallet)
+    smart_account_address = wallet.get("smart_account_address")
+    owner_account_name = wallet.get("owner_account_name") or wallet.get("account_name")
 
-        logger.info(f"✅ [BALANCE] Found wallet - Address: {smart_account_address}, Account: {owner_account_name}")
+    # For backwards compatibility, handle old wallets
+    if not smart_account_address:
+        smart_account_address = wallet.get("address")
 
-        # Return balance information
-        return {
-            "address": smart_account_address,
-            "account_name": owner_account_name,
-            "room_id": room_id,
-            "network": wallet.get("network", "base")  # Base Mainnet
-        }
+    logger.info(f"✅ [BALANCE] Found wallet - Address: {smart_account_address}, Account: {owner_account_name}")
 
-    except HTTPException:
-        # Re-raise HTTP exceptions as-is
-        raise
-    except Exception as e:
-        logger.error(f"❌ [BALANCE] Failed to retrieve balance: {str(e)}")
-        # Catch-all for unexpected errors
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve balance: {str(e)}"
-        )
+    # Return balance information
+    return BalanceResult.model_construct(
+        address=smart_account_address,
+        account_name=owner_account_name,
+        room_id=room_id,
+        network=wallet.get("network", "base")  # Base Mainnet
+    )
 
 
-async def handle_transfer(room_id: str, params: Dict[str, Any], cdp_client) -> Dict[str, Any]:
+@_wrap_errors("Failed to process transfer")
+async def handle_transfer(room_id: str, params: TransferParams, cdp_client) -> TransferResult:
     """
     Handle transfer action - send ETH via smart account with gas sponsorship.
 
@@ -149,132 +255,109 @@ async def handle_transfer(room_id: str, params: Dict[str, Any], cdp_client) -> D
 
     Args:
         room_id: Room identifier
-        params: Dict with 'to_address' and 'amount' (in ETH)
+        params: TransferParams with 'to_address' and 'amount' (in ETH)
         cdp_client: CDP client instance
 
     Returns:
-        Dict with user_op_hash, transaction_hash, status, block_explorer
+        TransferResult with user_op_hash, transaction_hash, status, block_explorer
 
     Raises:
         HTTPException: 400 for invalid params, 404 if wallet not found, 500 for errors
     """
     from wallet_api.database import get_wallet
 
-    # Validate required parameters
-    to_address = params.get("to_address")
-    amount = params.get("amount")
+    # Parameters arrive pre-validated as a typed model from execute_action()
+    to_address = params.to_address
+    amount = params.amount
 
-    if not to_address:
+    # Retrieve wallet from database
+    wallet = await get_wallet(room_id)
+    if not wallet:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Missing required parameter: to_address"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Wallet not found for room_id: {room_id}"
         )
 
-    if not amount:
+    owner_account_name = wallet.get("owner_account_name") or wallet.get("account_name")
+    if not owner_account_name:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Missing required parameter: amount"
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Wallet missing owner account name"
         )
 
+    # Get owner account
     try:
-        # Retrieve wallet from database
-        wallet = await get_wallet(room_id)
-        if not wallet:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Wallet not found for room_id: {room_id}"
-            )
-
-        owner_account_name = wallet.get("owner_account_name") or wallet.get("account_name")
-        if not owner_account_name:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Wallet missing owner account name"
-            )
-
-        # Get owner account
-        try:
-            owner_account = await cdp_client.evm.get_or_create_account(name=owner_account_name)
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to retrieve owner account: {str(e)}"
-            )
-
-        # Get smart account (idempotent - returns existing if already created)
-        try:
-            smart_account = await cdp_client.evm.get_or_create_smart_account(
-                name=owner_account_name,
-                owner=owner_account
-            )
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to retrieve smart account: {str(e)}"
-            )
-
-        # Send user operation (gas-sponsored!)
-        try:
-            from decimal import Decimal
-
-            from cdp.evm_call_types import EncodedCall
-            from web3 import Web3
-
-            user_operation = await cdp_client.evm.send_user_operation(
-                smart_account=smart_account,
-                network="base",  # Base Mainnet
-                calls=[
-                    EncodedCall(
-                        to=to_address,
-                        data="0x",
-                        value=Web3.to_wei(Decimal(amount), "ether")
-                    )
-                ]
-            )
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to send user operation: {str(e)}"
-            )
-
-        # Wait for confirmation
-        try:
-            confirmed = await cdp_client.evm.wait_for_user_operation(
-                smart_account_address=smart_account.address,
-                user_op_hash=user_operation.user_op_hash
-            )
-        except Exception:
-            # Return partial response if confirmation fails
-            return {
-                "user_op_hash": user_operation.user_op_hash,
-                "transaction_hash": None,
-                "status": user_operation.status,
-                "block_explorer": None
-            }
-
-        # Return success response
-        transaction_hash = confirmed.transaction_hash if confirmed.status == "complete" else None
-        block_explorer = f"https://basescan.org/tx/{transaction_hash}" if transaction_hash else None  # Base Mainnet
+        owner_account = await cdp_client.evm.get_or_create_account(name=owner_account_name)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve owner account: {str(e)}"
+        )
 
-        return {
-            "user_op_hash": user_operation.user_op_hash,
-            "transaction_hash": transaction_hash,
-            "status": confirmed.status,
-            "block_explorer": block_explorer
-        }
+    # Get smart account (idempotent - returns existing if already created)
+    try:
+        smart_account = await cdp_client.evm.get_or_create_smart_account(
+            name=owner_account_name,
+            owner=owner_account
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve smart account: {str(e)}"
+        )
 
-    except HTTPException:
-        # Re-raise HTTP exceptions as-is
-        raise
+    # Send user operation (gas-sponsored!)
+    try:
+        from cdp.evm_call_types import EncodedCall
+
+        user_operation = await cdp_client.evm.send_user_operation(
+            smart_account=smart_account,
+            network="base",  # Base Mainnet
+            calls=[
+                EncodedCall(
+                    to=to_address,
+                    data="0x",
+                    # amount is already a Decimal (validated by the model)
+                    value=int(amount * WEI_PER_ETHER)
+                )
+            ]
+        )
     except Exception as e:
-        # Catch-all for unexpected errors
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to process transfer: {str(e)}"
+            detail=f"Failed to send user operation: {str(e)}"
         )
 
+    # Wait for confirmation (exponential-backoff polling)
+    try:
+        confirmed = await _wait_for_user_operation(
+            cdp_client,
+            smart_account_address=smart_account.address,
+            user_op_hash=user_operation.user_op_hash
+        )
+    except Exception:
+        # Return partial response if confirmation fails
+        return TransferResult.model_construct(
+            user_op_hash=user_operation.user_op_hash,
+            transaction_hash=None,
+            status=user_operation.status,
+            block_explorer=None
+        )
+
+    # Return success response
+    transaction_hash = confirmed.transaction_hash if confirmed.status == "complete" else None
+    block_explorer = f"https://basescan.org/tx/{transaction_hash}" if transaction_hash else None  # Base Mainnet
+
+    return TransferResult.model_construct(
+        user_op_hash=user_operation.user_op_hash,
+        transaction_hash=transaction_hash,
+        status=confirmed.status,
+        block_explorer=block_explorer
+    )
 
-async def handle_swap(room_id: str, params: Dict[str, Any], cdp_client) -> Dict[str, Any]:
+
+@_wrap_errors("Failed to process swap")
+async def handle_swap(room_id: str, params: SwapParams, cdp_client) -> SwapResult:
     """
     Handle swap action - token swap via CDP Trade API (powered by 0x aggregator).
 
@@ -287,7 +370,7 @@ async def handle_swap(room_id: str, params: Dict[str, Any], cdp_client) -> Dict[
 
     Args:
         room_id: Room identifier
-        params: Dict with:
+        params: SwapParams with:
             - from_token: Token to sell (address or symbol like "ETH", "USDC")
             - to_token: Token to buy (address or symbol)
             - amount: Amount to sell (in token's base units or decimal string)
@@ -295,7 +378,7 @@ async def handle_swap(room_id: str, params: Dict[str, Any], cdp_client) -> Dict[
         cdp_client: CDP client instance
 
     Returns:
-        Dict with:
+        SwapResult with:
             - user_op_hash: User operation hash
             - transaction_hash: Blockchain transaction hash (after confirmation)
             - status: Operation status ("pending", "complete", etc.)
@@ -311,228 +394,202 @@ async def handle_swap(room_id: str, params: Dict[str, Any], cdp_client) -> Dict[
     from wallet_api.database import get_wallet
 
     logger.info(f"🔄 [SWAP] Initiating swap for room_id: {room_id}")
-    logger.info(f"📋 [SWAP] Parameters: from_token={params.get('from_token')}, to_token={params.get('to_token')}, amount={params.get('amount')}, slippage_bps={params.get('slippage_bps', 100)}")
+    logger.info(f"📋 [SWAP] Parameters: from_token={params.from_token}, to_token={params.to_token}, amount={params.amount}, slippage_bps={params.slippage_bps}")
+
+    # Parameters arrive pre-validated as a typed model from execute_action()
+    from_token = params.from_token
+    to_token = params.to_token
+    # The model guarantees an integral Decimal (base units); int() here is
+    # exact, never a truncation
+    amount = int(params.amount)
+    slippage_bps = params.slippage_bps  # Model default: 100 = 1% slippage
 
-    # Validate required parameters
-    from_token = params.get("from_token")
-    to_token = params.get("to_token")
-    amount = params.get("amount")
-    slippage_bps = params.get("slippage_bps", 100)  # Default: 1% slippage
+    # Resolve token symbols to addresses (supports both symbols like "USDC" and addresses like "0x833...")
+    from_token_address = resolve_token_address(from_token)
+    to_token_address = resolve_token_address(to_token)
+    logger.info(f"✅ [SWAP] Token resolution complete: {from_token} → {from_token_address}, {to_token} → {to_token_address}")
 
-    if not from_token:
-        logger.error("❌ [SWAP] Missing from_token parameter")
+    # Retrieve wallet from database
+    logger.info(f"🔍 [SWAP] Retrieving wallet for room_id: {room_id}")
+    wallet = await get_wallet(room_id)
+    if not wallet:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Missing required parameter: from_token"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Wallet not found for room_id: {room_id}"
         )
 
-    if not to_token:
-        logger.error("❌ [SWAP] Missing to_token parameter")
+    owner_account_name = wallet.get("owner_account_name") or wallet.get("account_name")
+    if not owner_account_name:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Missing required parameter: to_token"
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Wallet missing owner account name"
         )
 
-    if not amount:
-        logger.error("❌ [SWAP] Missing amount parameter")
+    # Get owner account
+    try:
+        owner_account = await cdp_client.evm.get_or_create_account(name=owner_account_name)
+    except Exception as e:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Missing required parameter: amount"
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve owner account: {str(e)}"
         )
 
-    # Resolve token symbols to addresses (supports both symbols like "USDC" and addresses like "0x833...")
-    from_token_address = resolve_token_address(from_token)
-    to_token_address = resolve_token_address(to_token)
-    logger.info(f"✅ [SWAP] Token resolution complete: {from_token} → {from_token_address}, {to_token} → {to_token_address}")
-
+    # Get smart account (idempotent - returns existing if already created)
     try:
-        # Retrieve wallet from database
-        logger.info(f"🔍 [SWAP] Retrieving wallet for room_id: {room_id}")
-        wallet = await get_wallet(room_id)
-        if not wallet:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Wallet not found for room_id: {room_id}"
-            )
+        smart_account = await cdp_client.evm.get_or_create_smart_account(
+            name=owner_account_name,
+            owner=owner_account
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve smart account: {str(e)}"
+        )
 
-        owner_account_name = wallet.get("owner_account_name") or wallet.get("account_name")
-        if not owner_account_name:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Wallet missing owner account name"
-            )
+    # Step 1: Approve Permit2 to spend tokens (required for ERC20 swaps)
+    # Skip approval for native ETH (address: 0x0000000000000000000000000000000000000000)
+    # Permit2 contract address is the module-level PERMIT2_ADDRESS constant
+
+    # Get paymaster URL from environment for gas sponsorship
+    import os
+    paymaster_url = os.getenv("CDP_PAYMASTER_URL")
 
-        # Get owner account
+    if from_token_address.lower() != "0x0000000000000000000000000000000000000000":  # Not native ETH
         try:
-            owner_account = await cdp_client.evm.get_or_create_account(name=owner_account_name)
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to retrieve owner account: {str(e)}"
+            logger.info(f"✍️ [SWAP] Approving Permit2 for token: {from_token_address}, amount: {amount}")
+            from cdp.evm_call_types import EncodedCall
+
+            # Encode ERC20 approve(address spender, uint256 amount) call using Web3 ABI encoder
+            from eth_abi import encode
+
+            # ERC20 approve function: approve(address spender, uint256 amount)
+            # Function selector: 0x095ea7b3
+            function_selector = "0x095ea7b3"
+            # Encode parameters: Permit2 address and amount * 10 (for safety margin)
+            encoded_params = encode(
+                ['address', 'uint256'],
+                [PERMIT2_ADDRESS, amount * 10]
+            ).hex()
+            approve_data = function_selector + encoded_params
+            logger.info(f"📝 [SWAP] Approval data encoded: {approve_data[:66]}...")
+
+            # Send approval user operation with gas sponsorship
+            logger.info(f"📤 [SWAP] Sending approval user operation with paymaster: {paymaster_url is not None}")
+            approval_op = await cdp_client.evm.send_user_operation(
+                smart_account=smart_account,
+                network="base",
+                calls=[
+                    EncodedCall(
+                        to=from_token_address,  # Token contract address (resolved)
+                        data=approve_data,
+                        value=0
+                    )
+                ],
+                paymaster_url=paymaster_url  # Gas sponsorship
             )
+            logger.info(f"✅ [SWAP] Approval operation sent - user_op_hash: {approval_op.user_op_hash}")
 
-        # Get smart account (idempotent - returns existing if already created)
-        try:
-            smart_account = await cdp_client.evm.get_or_create_smart_account(
-                name=owner_account_name,
-                owner=owner_account
+            # Wait for approval confirmation (exponential-backoff polling)
+            logger.info(f"⏳ [SWAP] Waiting for approval confirmation...")
+            await _wait_for_user_operation(
+                cdp_client,
+                smart_account_address=smart_account.address,
+                user_op_hash=approval_op.user_op_hash
             )
+            logger.info(f"✅ [SWAP] Approval confirmed!")
+
         except Exception as e:
+            logger.error(f"❌ [SWAP] Failed to approve Permit2: {str(e)}")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to retrieve smart account: {str(e)}"
+                detail=f"Failed to approve Permit2: {str(e)}"
             )
+    else:
+        logger.info(f"ℹ️ [SWAP] Skipping approval for native ETH")
 
-        # Step 1: Approve Permit2 to spend tokens (required for ERC20 swaps)
-        # Skip approval for native ETH (address: 0x0000000000000000000000000000000000000000)
-        permit2_address = "0x000000000022D473030F116dDEE9F6B43aC78BA3"
-
-        # Get paymaster URL from environment for gas sponsorship
-        import os
-        paymaster_url = os.getenv("CDP_PAYMASTER_URL")
-
-        if from_token_address.lower() != "0x0000000000000000000000000000000000000000":  # Not native ETH
-            try:
-                logger.info(f"✍️ [SWAP] Approving Permit2 for token: {from_token_address}, amount: {amount}")
-                from cdp.evm_call_types import EncodedCall
-
-                # Encode ERC20 approve(address spender, uint256 amount) call using Web3 ABI encoder
-                from eth_abi import encode
-                from web3 import Web3
-
-                # ERC20 approve function: approve(address spender, uint256 amount)
-                # Function selector: 0x095ea7b3
-                function_selector = "0x095ea7b3"
-                # Encode parameters: permit2_address and amount * 10 (for safety margin)
-                encoded_params = encode(
-                    ['address', 'uint256'],
-                    [Web3.to_checksum_address(permit2_address), int(amount) * 10]
-                ).hex()
-                approve_data = function_selector + encoded_params
-                logger.info(f"📝 [SWAP] Approval data encoded: {approve_data[:66]}...")
-
-                # Send approval user operation with gas sponsorship
-                logger.info(f"📤 [SWAP] Sending approval user operation with paymaster: {paymaster_url is not None}")
-                approval_op = await cdp_client.evm.send_user_operation(
-                    smart_account=smart_account,
-                    network="base",
-                    calls=[
-                        EncodedCall(
-                            to=from_token_address,  # Token contract address (resolved)
-                            data=approve_data,
-                            value=0
-                        )
-                    ],
-                    paymaster_url=paymaster_url  # Gas sponsorship
-                )
-                logger.info(f"✅ [SWAP] Approval operation sent - user_op_hash: {approval_op.user_op_hash}")
-
-                # Wait for approval confirmation
-                logger.info(f"⏳ [SWAP] Waiting for approval confirmation...")
-                await cdp_client.evm.wait_for_user_operation(
-                    smart_account_address=smart_account.address,
-                    user_op_hash=approval_op.user_op_hash
-                )
-                logger.info(f"✅ [SWAP] Approval confirmed!")
+    # Step 2: Execute swap
+    try:
+        logger.info(f"🔄 [SWAP] Preparing swap execution...")
+        logger.info(f"📊 [SWAP] Swap details: {from_token_address} → {to_token_address}, amount: {amount}, slippage: {slippage_bps}bps")
+
+        # Import SmartAccountSwapOptions
+        from cdp.actions.evm.swap import SmartAccountSwapOptions
+
+        # All-in-one swap method (now with Permit2 approval set)
+        swap_options = SmartAccountSwapOptions(
+            network="base",
+            from_token=from_token_address,  # Use resolved address
+            to_token=to_token_address,       # Use resolved address
+            from_amount=str(amount),
+            slippage_bps=slippage_bps
+        )
 
-            except Exception as e:
-                logger.error(f"❌ [SWAP] Failed to approve Permit2: {str(e)}")
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Failed to approve Permit2: {str(e)}"
-                )
+        # Add paymaster URL if available for gas sponsorship
+        if paymaster_url:
+            swap_options.paymaster_url = paymaster_url
+            logger.info(f"⛽ [SWAP] Using paymaster for gas sponsorship")
         else:
-            logger.info(f"ℹ️ [SWAP] Skipping approval for native ETH")
+            logger.warning(f"⚠️ [SWAP] No paymaster URL configured - user will pay gas")
 
-        # Step 2: Execute swap
-        try:
-            logger.info(f"🔄 [SWAP] Preparing swap execution...")
-            logger.info(f"📊 [SWAP] Swap details: {from_token_address} → {to_token_address}, amount: {amount}, slippage: {slippage_bps}bps")
+        logger.info(f"📤 [SWAP] Executing swap via CDP Trade API...")
+        result = await smart_account.swap(swap_options)
 
-            # Import SmartAccountSwapOptions
-            from cdp.actions.evm.swap import SmartAccountSwapOptions
+        user_op_hash = result.user_op_hash
+        logger.info(f"✅ [SWAP] Swap submitted - user_op_hash: {user_op_hash}")
 
-            # All-in-one swap method (now with Permit2 approval set)
-            swap_options = SmartAccountSwapOptions(
-                network="base",
-                from_token=from_token_address,  # Use resolved address
-                to_token=to_token_address,       # Use resolved address
-                from_amount=str(amount),
-                slippage_bps=slippage_bps
-            )
-
-            # Add paymaster URL if available for gas sponsorship
-            if paymaster_url:
-                swap_options.paymaster_url = paymaster_url
-                logger.info(f"⛽ [SWAP] Using paymaster for gas sponsorship")
-            else:
-                logger.warning(f"⚠️ [SWAP] No paymaster URL configured - user will pay gas")
-
-            logger.info(f"📤 [SWAP] Executing swap via CDP Trade API...")
-            result = await smart_account.swap(swap_options)
-
-            user_op_hash = result.user_op_hash
-            logger.info(f"✅ [SWAP] Swap submitted - user_op_hash: {user_op_hash}")
-
-            # Store swap details for response
-            swap_from_amount = str(amount)
-            swap_to_amount = getattr(result, 'to_amount', None)
-            logger.info(f"💱 [SWAP] Expected output: {swap_to_amount} {to_token}")
+        # Store swap details for response
+        swap_from_amount = str(amount)
+        swap_to_amount = getattr(result, 'to_amount', None)
+        logger.info(f"💱 [SWAP] Expected output: {swap_to_amount} {to_token}")
 
-        except Exception as e:
-            logger.error(f"❌ [SWAP] Failed to execute swap: {str(e)}")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to execute swap: {str(e)}"
-            )
-
-        # Wait for confirmation
-        try:
-            logger.info(f"⏳ [SWAP] Waiting for transaction confirmation...")
-            receipt = await smart_account.wait_for_user_operation(user_op_hash=user_op_hash)
-            logger.info(f"✅ [SWAP] Transaction confirmed - status: {receipt.status}")
-        except Exception as e:
-            logger.warning(f"⚠️ [SWAP] Confirmation timeout or error: {str(e)}")
-            # Return partial response if confirmation fails
-            return {
-                "user_op_hash": user_op_hash,
-                "transaction_hash": None,
-                "status": "pending",
-                "from_token": from_token,
-                "to_token": to_token,
-                "from_amount": swap_from_amount,
-                "to_amount": swap_to_amount,
-                "block_explorer": None
-            }
-
-        # Return success response
-        transaction_hash = receipt.transaction_hash if receipt.status == "complete" else None
-        block_explorer = f"https://basescan.org/tx/{transaction_hash}" if transaction_hash else None  # Base Mainnet
-
-        logger.info(f"🎉 [SWAP] Swap complete! Transaction: {transaction_hash}")
-        logger.info(f"🔗 [SWAP] Block explorer: {block_explorer}")
-
-        return {
-            "user_op_hash": user_op_hash,
-            "transaction_hash": transaction_hash,
-            "status": receipt.status,
-            "from_token": from_token,
-            "to_token": to_token,
-            "from_amount": swap_from_amount,
-            "to_amount": swap_to_amount,
-            "block_explorer": block_explorer
-        }
-
-    except HTTPException:
-        # Re-raise HTTP exceptions as-is
-        raise
     except Exception as e:
-        # Catch-all for unexpected errors
+        logger.error(f"❌ [SWAP] Failed to execute swap: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to process swap: {str(e)}"
+            detail=f"Failed to execute swap: {str(e)}"
+        )
+
+    # Wait for confirmation (exponential-backoff polling)
+    try:
+        logger.info(f"⏳ [SWAP] Waiting for transaction confirmation...")
+        receipt = await _wait_for_user_operation(
+            cdp_client,
+            smart_account_address=smart_account.address,
+            user_op_hash=user_op_hash
+        )
+        logger.info(f"✅ [SWAP] Transaction confirmed - status: {receipt.status}")
+    except Exception as e:
+        logger.warning(f"⚠️ [SWAP] Confirmation timeout or error: {str(e)}")
+        # Return partial response if confirmation fails
+        return SwapResult.model_construct(
+            user_op_hash=user_op_hash,
+            transaction_hash=None,
+            status="pending",
+            from_token=from_token,
+            to_token=to_token,
+            from_amount=swap_from_amount,
+            to_amount=swap_to_amount,
+            block_explorer=None
         )
 
+    # Return success response
+    transaction_hash = receipt.transaction_hash if receipt.status == "complete" else None
+    block_explorer = f"https://basescan.org/tx/{transaction_hash}" if transaction_hash else None  # Base Mainnet
+
+    logger.info(f"🎉 [SWAP] Swap complete! Transaction: {transaction_hash}")
+    logger.info(f"🔗 [SWAP] Block explorer: {block_explorer}")
+
+    return SwapResult.model_construct(
+        user_op_hash=user_op_hash,
+        transaction_hash=transaction_hash,
+        status=receipt.status,
+        from_token=from_token,
+        to_token=to_token,
+        from_amount=swap_from_amount,
+        to_amount=swap_to_amount,
+        block_explorer=block_explorer
+    )
+
 
 # ============================================================================
 # ACTION DISPATCHER
@@ -543,7 +600,7 @@ async def execute_action(
     action: str,
     params: Dict[str, Any],
     cdp_client
-) -> Dict[str, Any]:
+) -> ActionResult:
     """
     Execute a wallet action dynamically based on action type.
 
@@ -557,26 +614,58 @@ async def execute_action(
         cdp_client: CDP client instance
 
     Returns:
-        Dict with action result (structure varies by action type)
+        Typed action result model (BalanceResult, TransferResult, or
+        SwapResult, depending on the action)
 
     Raises:
-        HTTPException: 400 for invalid action, or handler-specific errors
+        HTTPException: 400 for invalid action or missing parameters,
+            or handler-specific errors
     """
-    # Get action registry
-    supported_actions = get_supported_actions()
-
     # Validate action
-    if action not in supported_actions:
+    if action not in _ACTION_REGISTRY:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid action: {action}. Supported actions: {', '.join(supported_actions.keys())}"
+            detail=f"Invalid action: {action}. Supported actions: {', '.join(_ACTION_REGISTRY.keys())}"
         )
 
-    # Get handler function
-    handler = supported_actions[action]["handler"]
+    registry_entry = _ACTION_REGISTRY[action]
+
+    # Parse params through the tagged union: the URL action is injected as
+    # the discriminator, so pydantic-core jumps straight to the matching
+    # model with one key lookup and validates the known fields in Rust
+    # instead of walking a generic Dict[str, Any]. Handlers get plain
+    # attribute access with no extra dict copies. "missing" and
+    # empty-string errors map onto the same 400 message the old
+    # declarative check produced (union error locs are (tag, field), so
+    # take the last element).
+    try:
+        typed_params = ACTION_PARAMS_ADAPTER.validate_python(
+            {**params, "action": action}
+        )
+    except ValidationError as e:
+        missing = [
+            str(err["loc"][-1]) for err in e.errors()
+            if err["type"] in ("missing", "string_too_short")
+        ]
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Missing required parameter(s): {', '.join(missing)}"
+            )
+        # Summarize field-level problems instead of dumping str(e), which
+        # leaks pydantic internals (union tag names, docs URLs) to clients
+        problems = "; ".join(
+            f"{err['loc'][-1] if err['loc'] else 'params'}: "
+            f"{err['msg'].removeprefix('Value error, ')}"
+            for err in e.errors()
+        )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid parameters for action '{action}': {problems}"
+        )
 
     # Execute action
-    result = await handler(room_id, params, cdp_client)
+    result = await registry_entry["handler"](room_id, typed_params, cdp_client)
 
     return result
 
@@ -594,24 +683,35 @@ def get_supported_actions() -> Dict[str, Dict[str, Any]]:
             "action_name": {
                 "handler": async function,
                 "description": str,
-                "required_params": list of str
+                "required_params": list of str,
+                "params_model": pydantic model class for the params
             }
         }
     """
+    # Keys are the interned action constants, so registry lookups and the
+    # action Literals all share one string object per value
     return {
-        "balance": {
+        ACTION_BALANCE: {
             "handler": handle_balance,
             "description": "Get wallet balance and address information",
-            "required_params": []
+            "required_params": [],
+            "params_model": BalanceParams
         },
-        "transfer": {
+        ACTION_TRANSFER: {
             "handler": handle_transfer,
             "description": "Send ETH transfer via smart account (gas-sponsored)",
-            "required_params": ["to_address", "amount"]
+            "required_params": ["to_address", "amount"],
+            "params_model": TransferParams
         },
-        "swap": {
+        ACTION_SWAP: {
             "handler": handle_swap,
             "description": "Swap tokens via CDP Trade API (powered by 0x aggregator)",
-            "required_params": ["from_token", "to_token", "amount"]
+            "required_params": ["from_token", "to_token", "amount"],
+            "params_model": SwapParams
         }
     }
+
+
+# Module-level registry snapshot used by execute_action() so dispatch and
+# required-parameter validation don't rebuild the dict on every request.
+_ACTION_REGISTRY = get_supported_actions()
@@ -30,15 +30,140 @@ Usage:
     wallet = await get_wallet(room_id="123")
 """
 
+import asyncio
+import logging
 import os
-import sys
-from typing import Optional, Dict, Any
-from pathlib import Path
+import time
+from typing import Optional, Dict, Any, Tuple
 
-# Add parent directory to path to import config
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import httpx
+from postgrest import AsyncPostgrestClient
 
-from config import create_supabase_client
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# POSTGREST CLIENT (shared async pool)
+# ============================================================================
+
+# One AsyncPostgrestClient for the whole process instead of a fresh sync
+# client (and TCP+TLS handshake) per call. The underlying httpx pool keeps
+# connections alive and HTTP/2 multiplexes concurrent queries - e.g. a
+# history page fetch and its count, or a log flush overlapping a wallet
+# read - over a single socket. The app's lifespan hook owns the instance;
+# scripts that import this module outside the app get a lazily built one.
+_POSTGREST_CLIENT: Optional[AsyncPostgrestClient] = None
+
+
+def create_postgrest_client() -> AsyncPostgrestClient:
+    """
+    Build an async PostgREST client backed by a pooled HTTP/2 transport.
+
+    Reads SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY from the environment
+    (same variables config.create_supabase_client() uses).
+
+    Returns:
+        AsyncPostgrestClient pointed at the project's /rest/v1 endpoint
+
+    Raises:
+        ValueError: If the required environment variables are missing
+    """
+    supabase_url = os.getenv("SUPABASE_URL")
+    supabase_key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
+
+    if not supabase_url or not supabase_key:
+        raise ValueError(
+            "SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY environment variables must be set"
+        )
+
+    return AsyncPostgrestClient(
+        f"{supabase_url}/rest/v1",
+        headers={
+            "apikey": supabase_key,
+            "Authorization": f"Bearer {supabase_key}"
+        },
+        http_client=httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+            timeout=30.0
+        )
+    )
+
+
+def set_postgrest_client(client: AsyncPostgrestClient) -> None:
+    """Inject the shared PostgREST client (called from the app's lifespan)."""
+    global _POSTGREST_CLIENT
+    _POSTGREST_CLIENT = client
+
+
+async def close_postgrest_client() -> None:
+    """Close the shared PostgREST client and its connection pool."""
+    global _POSTGREST_CLIENT
+    if _POSTGREST_CLIENT is not None:
+        await _POSTGREST_CLIENT.aclose()
+        _POSTGREST_CLIENT = None
+
+
+def _db() -> AsyncPostgrestClient:
+    """Return the shared PostgREST client, building one lazily if needed."""
+    global _POSTGREST_CLIENT
+    if _POSTGREST_CLIENT is None:
+        _POSTGREST_CLIENT = create_postgrest_client()
+    return _POSTGREST_CLIENT
+
+
+# ============================================================================
+# WALLET CACHE (in-process TTL)
+# ============================================================================
+
+# Wallet rows are effectively immutable after creation, so repeat reads of the
+# same room can be served from memory instead of a Supabase round-trip.
+# Maps room_id -> (expiry timestamp, wallet record).
+_WALLET_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_WALLET_CACHE_TTL_SECONDS = 300.0
+
+
+def _get_cached_wallet(room_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Return the cached wallet record for a room, or None on miss/expiry.
+
+    This is a pure cache peek - it never hits the database. Callers that
+    need a guaranteed answer should fall back to get_wallet() on a miss.
+
+    Args:
+        room_id: Room identifier
+
+    Returns:
+        Dict containing the cached wallet record, or None if not cached
+    """
+    entry = _WALLET_CACHE.get(room_id)
+    if entry is None:
+        return None
+
+    expires_at, wallet = entry
+    if expires_at < time.monotonic():
+        # Expired - drop the stale entry
+        _WALLET_CACHE.pop(room_id, None)
+        return None
+
+    return wallet
+
+
+def _cache_wallet(room_id: str, wallet: Dict[str, Any]) -> None:
+    """Store a wallet record in the TTL cache."""
+    _WALLET_CACHE[room_id] = (time.monotonic() + _WALLET_CACHE_TTL_SECONDS, wallet)
+
+
+def invalidate_wallet_cache(room_id: str) -> None:
+    """Remove a room's wallet record from the TTL cache (if present)."""
+    _WALLET_CACHE.pop(room_id, None)
+
+
+# Single-flight map: one in-flight wallet query per room_id, shared by all
+# concurrent awaiters so a burst of actions for the same room fires a single
+# SELECT instead of one per coroutine.
+_WALLET_FETCH_INFLIGHT: Dict[str, "asyncio.Future"] = {}
+_WALLET_FETCH_LOCK = asyncio.Lock()
 
 
 async def create_wallet(
@@ -59,34 +184,55 @@ async def create_wallet(
         network: Network identifier (default: "base-sepolia")
 
     Returns:
-        Dict containing the created wallet record
+        Dict containing the created wallet record (the fields sent to the
+        database - callers already know every value, so the server is asked
+        not to echo the row back)
 
     Raises:
         Exception: If database operation fails (e.g., duplicate room_id/account_name)
     """
-    supabase = create_supabase_client()
+    pg = _db()
 
-    # Insert wallet record with smart account fields
-    result = supabase.table("agent_wallets").insert({
+    # Wallet record with smart account fields
+    wallet = {
         "room_id": room_id,
         "owner_account_name": owner_account_name,
         "address": owner_address,  # Owner EOA address
         "smart_account_address": smart_account_address,  # Trading wallet
         "account_name": owner_account_name,  # For backwards compatibility
         "network": network
-    }).execute()
+    }
 
-    # Supabase returns data in result.data
-    if not result.data or len(result.data) == 0:
-        raise Exception("Failed to create wallet record in database")
+    # Insert with Prefer: return=minimal - skips PG->PostgREST row
+    # serialization; a failed insert (e.g., duplicate room_id) raises
+    await pg.from_("agent_wallets").insert(wallet, returning="minimal").execute()
 
-    return result.data[0]
+    return wallet
+
+
+async def _fetch_wallet(room_id: str) -> Optional[Dict[str, Any]]:
+    """Query the wallet row for a room from Supabase (no deduplication)."""
+    pg = _db()
+
+    # Query wallet by room_id
+    result = await pg.from_("agent_wallets").select("*").eq("room_id", room_id).execute()
+
+    # Return first result or None
+    if result.data and len(result.data) > 0:
+        wallet = result.data[0]
+        _cache_wallet(room_id, wallet)
+        return wallet
+    return None
 
 
 async def get_wallet(room_id: str) -> Optional[Dict[str, Any]]:
     """
     Retrieve wallet information by room_id.
 
+    Concurrent calls for the same room share a single in-flight query
+    (single-flight): the first caller runs the SELECT while the rest await
+    its result, eliminating duplicate round-trips under bursty load.
+
     Args:
         room_id: Room identifier
 
@@ -96,15 +242,109 @@ async def get_wallet(room_id: str) -> Optional[Dict[str, Any]]:
     Raises:
         Exception: If database operation fails
     """
-    supabase = create_supabase_client()
+    async with _WALLET_FETCH_LOCK:
+        future = _WALLET_FETCH_INFLIGHT.get(room_id)
+        if future is not None:
+            leader = False
+        else:
+            future = asyncio.get_running_loop().create_future()
+            # Mark any exception as retrieved even if no follower awaits it
+            future.add_done_callback(
+                lambda f: f.exception() if not f.cancelled() else None
+            )
+            _WALLET_FETCH_INFLIGHT[room_id] = future
+            leader = True
+
+    if not leader:
+        # Another coroutine is already querying this room - share its result
+        return await future
+
+    try:
+        wallet = await _fetch_wallet(room_id)
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(wallet)
+        return wallet
+    finally:
+        async with _WALLET_FETCH_LOCK:
+            _WALLET_FETCH_INFLIGHT.pop(room_id, None)
+
+
+async def create_wallet_if_absent(
+    room_id: str,
+    owner_account_name: str,
+    owner_address: str,
+    smart_account_address: str,
+    network: str = "base"  # Base Mainnet
+) -> Optional[Dict[str, Any]]:
+    """
+    Atomically create a wallet record unless one already exists for the room.
 
-    # Query wallet by room_id
-    result = supabase.table("agent_wallets").select("*").eq("room_id", room_id).execute()
+    Calls the create_wallet_if_absent RPC (see db/migrations), which folds
+    the existence check and insert into a single INSERT ... ON CONFLICT
+    DO NOTHING statement - one database round-trip instead of two.
 
-    # Return first result or None
-    if result.data and len(result.data) > 0:
-        return result.data[0]
-    return None
+    Args:
+        room_id: Room identifier
+        owner_account_name: CDP account name for owner EOA
+        owner_address: Owner account blockchain address (EOA)
+        smart_account_address: Smart account address (ERC-4337 trading wallet)
+        network: Network identifier (default: "base")
+
+    Returns:
+        Dict containing the created wallet record, or None if a wallet
+        already exists for this room
+
+    Raises:
+        Exception: If database operation fails
+    """
+    pg = _db()
+
+    result = await pg.rpc("create_wallet_if_absent", {
+        "p_room_id": room_id,
+        "p_owner_account_name": owner_account_name,
+        "p_owner_address": owner_address,
+        "p_smart_account_address": smart_account_address,
+        "p_network": network
+    }).execute()
+
+    rows = result.data or []
+    if not rows:
+        # Conflict: wallet already exists for this room
+        return None
+
+    wallet = rows[0]
+    _cache_wallet(room_id, wallet)
+    return wallet
+
+
+async def get_wallet_cached(room_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Retrieve wallet information by room_id, preferring the TTL cache.
+
+    Wallet rows are effectively immutable post-creation, so endpoints that
+    only need to verify existence (or read the static addresses) can serve
+    repeat requests from memory. Cache misses (and expired entries) fall
+    back to get_wallet(), which re-primes the cache; rooms without a wallet
+    are not negatively cached, so a fresh wallet becomes visible on the
+    next request.
+
+    Args:
+        room_id: Room identifier
+
+    Returns:
+        Dict containing wallet record, or None if not found
+
+    Raises:
+        Exception: If database operation fails
+    """
+    wallet = _get_cached_wallet(room_id)
+    if wallet is not None:
+        return wallet
+
+    return await get_wallet(room_id)
 
 
 async def wallet_exists(room_id: str) -> bool:
@@ -139,10 +379,10 @@ async def get_wallet_by_account_name(account_name: str) -> Optional[Dict[str, An
     Raises:
         Exception: If database operation fails
     """
-    supabase = create_supabase_client()
+    pg = _db()
 
     # Query wallet by account_name
-    result = supabase.table("agent_wallets").select("*").eq("account_name", account_name).execute()
+    result = await pg.from_("agent_wallets").select("*").eq("account_name", account_name).execute()
 
     # Return first result or None
     if result.data and len(result.data) > 0:
@@ -164,11 +404,11 @@ async def list_wallets(limit: int = 100, offset: int = 0) -> list[Dict[str, Any]
     Raises:
         Exception: If database operation fails
     """
-    supabase = create_supabase_client()
+    pg = _db()
 
     # Query wallets with pagination
-    result = (
-        supabase.table("agent_wallets")
+    result = await (
+        pg.from_("agent_wallets")
         .select("*")
         .order("created_at", desc=True)
         .range(offset, offset + limit - 1)
@@ -194,10 +434,14 @@ async def delete_wallet(room_id: str) -> bool:
     Raises:
         Exception: If database operation fails
     """
-    supabase = create_supabase_client()
+    pg = _db()
 
     # Delete wallet record
-    result = supabase.table("agent_wallets").delete().eq("room_id", room_id).execute()
+    result = await pg.from_("agent_wallets").delete().eq("room_id", room_id).execute()
+
+    # Drop the cached record too, or get_wallet_cached() would keep
+    # serving the deleted wallet until its TTL expires
+    invalidate_wallet_cache(room_id)
 
     # Return True if at least one row was deleted
     return result.data and len(result.data) > 0
@@ -207,6 +451,117 @@ async def delete_wallet(room_id: str) -> bool:
 # TRANSACTION LOGGING (Day 3 - Dynamic Action Router)
 # ============================================================================
 
+# Queue of transaction-log records drained by transaction_log_flusher().
+# Endpoints enqueue full records (client-generated UUID ids) instead of
+# awaiting Supabase, so audit logging costs zero round-trips on the request
+# path. Records for the same id are merged in the flusher, last write wins.
+_TXN_LOG_QUEUE: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue()
+
+# Flush whenever this many records accumulate, or after the delay elapses
+_TXN_LOG_MAX_BATCH = 500
+_TXN_LOG_MAX_DELAY_SECONDS = 0.1
+
+
+def enqueue_transaction_log(record: Dict[str, Any]) -> None:
+    """
+    Queue a transaction-log record for background batched writing.
+
+    The record must carry a full row image (id, room_id, action, params,
+    status, result, error) so batched upserts stay uniform; the 'id' is a
+    client-generated UUID, letting a pending insert and its later
+    success/failed update share the same key.
+
+    Args:
+        record: Full wallet_transactions row as dict
+    """
+    _TXN_LOG_QUEUE.put_nowait(record)
+
+
+async def _upsert_transaction_logs(records: list[Dict[str, Any]]) -> None:
+    """
+    Write a batch of transaction-log records in a single upsert.
+
+    Records are deduplicated by id (last write wins) so a pending insert and
+    its success/failed update landing in the same batch don't make Postgres
+    try to affect the same row twice in one statement.
+    """
+    if not records:
+        return
+
+    # Last record per id wins (dict preserves insertion order)
+    merged = {record["id"]: record for record in records}
+
+    pg = _db()
+    await pg.from_("wallet_transactions").upsert(
+        list(merged.values()),
+        on_conflict="id",
+        returning="minimal"
+    ).execute()
+
+
+async def transaction_log_flusher() -> None:
+    """
+    Background task that drains the transaction-log queue in batches.
+
+    Accumulates records until _TXN_LOG_MAX_BATCH rows are queued or
+    _TXN_LOG_MAX_DELAY_SECONDS elapse after the first record, then issues
+    one batched upsert. Runs until cancelled (by the app's lifespan
+    shutdown); failures are logged and never crash the task - audit logging
+    must not take the API down.
+    """
+    loop = asyncio.get_running_loop()
+
+    while True:
+        # Block until there's at least one record to write
+        batch = [await _TXN_LOG_QUEUE.get()]
+        deadline = loop.time() + _TXN_LOG_MAX_DELAY_SECONDS
+
+        try:
+            # Gather more records until the batch fills or the delay expires
+            while len(batch) < _TXN_LOG_MAX_BATCH:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(_TXN_LOG_QUEUE.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            await _upsert_transaction_logs(batch)
+        except asyncio.CancelledError:
+            # Shutdown hit mid-accumulation (or mid-write): put the
+            # in-flight batch back so flush_pending_transaction_logs()
+            # sees and writes it - otherwise up to a full batch of audit
+            # records would vanish on every deploy
+            for record in batch:
+                _TXN_LOG_QUEUE.put_nowait(record)
+            raise
+        except Exception as e:
+            # Swallow and log - losing an audit batch must not kill the task
+            logger.warning("Failed to flush %d transaction log(s): %s", len(batch), str(e))
+
+
+async def flush_pending_transaction_logs() -> None:
+    """
+    Drain and write whatever is left in the transaction-log queue.
+
+    Called on application shutdown after the flusher task is cancelled so
+    no queued audit records are dropped.
+    """
+    remaining: list[Dict[str, Any]] = []
+    while True:
+        try:
+            remaining.append(_TXN_LOG_QUEUE.get_nowait())
+        except asyncio.QueueEmpty:
+            break
+
+    try:
+        await _upsert_transaction_logs(remaining)
+    except Exception as e:
+        logger.warning(
+            "Failed to flush %d transaction log(s) on shutdown: %s", len(remaining), str(e)
+        )
+
 async def log_transaction(
     room_id: str,
     action: str,
@@ -234,10 +589,10 @@ async def log_transaction(
     Raises:
         Exception: If database operation fails
     """
-    supabase = create_supabase_client()
+    pg = _db()
 
     # Insert transaction log
-    result = supabase.table("wallet_transactions").insert({
+    result = await pg.from_("wallet_transactions").insert({
         "room_id": room_id,
         "action": action,
         "params": params,
@@ -256,32 +611,32 @@ async def update_transaction(
     status: str,
     result: Optional[Dict[str, Any]] = None,
     error: Optional[str] = None
-) -> Dict[str, Any]:
+) -> None:
     """
     Update a transaction log entry with execution result.
 
     This is called after action execution to record the outcome.
     NO AUTOMATIC RETRY: Failed transactions remain in 'failed' status for manual review.
 
+    The update is sent with Prefer: return=minimal so PostgREST skips
+    serializing the row back - callers that need the updated record should
+    fetch it lazily via get_transaction(). The updated_at column is
+    maintained by a server-side trigger (see db/migrations), so no
+    client-provided timestamp is sent.
+
     Args:
         transaction_id: Transaction ID (UUID)
         status: Final status ('success' or 'failed')
         result: Success result data as dict (stored as JSONB, optional)
         error: Error message if status is 'failed' (optional)
 
-    Returns:
-        Dict containing the updated transaction record
-
     Raises:
         Exception: If database operation fails
     """
-    supabase = create_supabase_client()
+    pg = _db()
 
-    # Build update data
-    update_data = {
-        "status": status,
-        "updated_at": "now()"  # Supabase will handle this
-    }
+    # Build update data (updated_at handled by server-side trigger)
+    update_data = {"status": status}
 
     if result is not None:
         update_data["result"] = result
@@ -289,30 +644,68 @@ async def update_transaction(
     if error is not None:
         update_data["error"] = error
 
-    # Update transaction record
-    db_result = supabase.table("wallet_transactions").update(update_data).eq("id", transaction_id).execute()
+    # Update transaction record; minimal return skips row serialization
+    await pg.from_("wallet_transactions").update(
+        update_data,
+        returning="minimal"
+    ).eq("id", transaction_id).execute()
+
 
-    # Supabase returns updated data in result.data
-    if not db_result.data or len(db_result.data) == 0:
-        raise Exception(f"Failed to update transaction {transaction_id} in database")
+async def get_transaction(transaction_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Retrieve a single transaction record by id.
 
-    return db_result.data[0]
+    Companion to update_transaction(), which no longer returns the updated
+    row - callers that need the record fetch it here on demand.
+
+    Args:
+        transaction_id: Transaction ID (UUID)
+
+    Returns:
+        Dict containing the transaction record, or None if not found
+
+    Raises:
+        Exception: If database operation fails
+    """
+    pg = _db()
+
+    result = await pg.from_("wallet_transactions").select("*").eq("id", transaction_id).execute()
+
+    if result.data and len(result.data) > 0:
+        return result.data[0]
+    return None
 
 
 async def get_transactions(
     room_id: str,
     limit: int = 50,
     offset: int = 0,
-    status: Optional[str] = None
+    status: Optional[str] = None,
+    after_created_at: Optional[str] = None,
+    after_id: Optional[str] = None
 ) -> list[Dict[str, Any]]:
     """
     Retrieve transaction history for a room with pagination.
 
+    Reads are backed by the (room_id, status, created_at DESC) composite
+    index (db/migrations/003), so both the filtered and unfiltered
+    variants are index range scans. When after_created_at is given,
+    keyset pagination is used instead of OFFSET: Postgres seeks straight
+    to the cursor position (O(log N)) rather than scanning and discarding
+    offset rows (O(N)), which matters for deep history pages.
+
     Args:
         room_id: Room identifier
         limit: Maximum number of records to return (default: 50)
-        offset: Number of records to skip (default: 0)
+        offset: Number of records to skip (default: 0); ignored when
+            after_created_at is provided
         status: Filter by status ('pending', 'success', 'failed'), or None for all
+        after_created_at: Keyset cursor - return only records created
+            strictly before this timestamp (the created_at of the last
+            record on the previous page)
+        after_id: Tie-breaker for the keyset cursor - the id of the last
+            record on the previous page, used to disambiguate records
+            sharing the same created_at
 
     Returns:
         List of transaction records, ordered by created_at (newest first)
@@ -320,12 +713,14 @@ async def get_transactions(
     Raises:
         Exception: If database operation fails
     """
-    supabase = create_supabase_client()
+    pg = _db()
 
-    # Build query
+    # Build query. room_id is filtered on but not fetched: the history
+    # response carries it once at the top level, so pulling it per row
+    # would only add redundant bytes to the wire and the page
     query = (
-        supabase.table("wallet_transactions")
-        .select("*")
+        pg.from_("wallet_transactions")
+        .select("id,action,params,status,result,error,created_at,updated_at")
         .eq("room_id", room_id)
     )
 
@@ -333,12 +728,58 @@ async def get_transactions(
     if status:
         query = query.eq("status", status)
 
-    # Execute query with pagination and ordering
-    result = (
-        query
-        .order("created_at", desc=True)
-        .range(offset, offset + limit - 1)
-        .execute()
-    )
+    query = query.order("created_at", desc=True).order("id", desc=True)
+
+    # Keyset cursor beats OFFSET for deep pages: seek, don't skip. The id
+    # tie-breaker makes the ordering total, so records sharing a
+    # created_at are neither skipped nor repeated across pages
+    if after_created_at and after_id:
+        result = await (
+            query.or_(
+                f"created_at.lt.{after_created_at},"
+                f"and(created_at.eq.{after_created_at},id.lt.{after_id})"
+            )
+            .limit(limit)
+            .execute()
+        )
+    elif after_created_at:
+        result = await query.lt("created_at", after_created_at).limit(limit).execute()
+    else:
+        result = await query.range(offset, offset + limit - 1).execute()
 
     return result.data or []
+
+
+async def count_transactions(room_id: str, status: Optional[str] = None) -> int:
+    """
+    Count transactions for a room without fetching any rows.
+
+    Uses PostgREST's count=exact with a HEAD request, so Postgres returns
+    only the count header - no row serialization, no egress.
+
+    Args:
+        room_id: Room identifier
+        status: Filter by status ('pending', 'success', 'failed'), or None for all
+
+    Returns:
+        Exact number of matching transaction records
+
+    Raises:
+        Exception: If database operation fails
+    """
+    pg = _db()
+
+    # Build count-only query (head=True suppresses the body entirely)
+    query = (
+        pg.from_("wallet_transactions")
+        .select("id", count="exact", head=True)
+        .eq("room_id", room_id)
+    )
+
+    # Apply status filter if provided
+    if status:
+        query = query.eq("status", status)
+
+    result = await query.execute()
+
+    return result.count or 0
